@@ -4,7 +4,7 @@
 API Total Usage CSV Extractor
 ==============================================================================
 This script extracts Total Usage API calls from Salesforce Event Log Files
-using Salesforce CLI commands for authentication and querying.
+using Salesforce CLI commands for authentication and the REST API for querying.
 
 Prerequisites:
 1. Python 3.6+
@@ -26,19 +26,73 @@ Note: Use 'which python3' or 'which python' to find the correct python path for
 """
 
 import sys
+import gzip
 import json
 import logging
+import shutil
 import subprocess
+import tempfile
+import threading
 import argparse
 import requests
 import os
+from contextlib import contextmanager
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+# fcntl is not available on Windows; authentication then runs without a cross-process lock
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# orjson is optional; it parses JSON faster than the standard library when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Salesforce limits concurrent API requests per user, so keep parallel downloads small
+DEFAULT_DOWNLOAD_WORKERS = 4
+MAX_DOWNLOAD_WORKERS = 10
+
+# Buffer size for copying downloaded CSV data to disk
+CHUNK_SIZE = 1024 * 1024
+
+# A streamed body shorter than LogFileLength is downloaded once more before giving up
+DOWNLOAD_ATTEMPTS = 2
+
+# Composite Batch accepts at most 25 sub-requests; larger days are streamed file by file
+COMPOSITE_BATCH_LIMIT = 25
+COMPOSITE_BATCH_MAX_BYTES = 100 * 1024 * 1024
+
+# Fastest gzip level; CSV text still shrinks several times over
+GZIP_COMPRESS_LEVEL = 1
+
+# Minimum connection pool size for the shared HTTP session; grows with --max-workers
+HTTP_POOL_SIZE = 8
+
+# How long a cached access token is reused before re-running the JWT login.
+# Kept well below the default Salesforce session timeout of 2 hours.
+TOKEN_CACHE_TTL = timedelta(hours=1)
+TOKEN_EXPIRY_MARGIN = timedelta(seconds=60)
+
+
+def parse_json(data: bytes):
+    """Parse JSON bytes with orjson when available, falling back to the json module."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 class SalesforceAPITotalUsageExtractor:
-    def __init__(self, client_id: str, username: str, jwt_key_file: str, instance_url: str, org_alias: str, output_dir: str):
+    def __init__(self, client_id: str, username: str, jwt_key_file: str, instance_url: str, org_alias: str, output_dir: str,
+                 max_workers: int = DEFAULT_DOWNLOAD_WORKERS, compress: bool = False):
         """Initialize the Salesforce API extractor with configuration from command line arguments."""
         # Configuration from command line arguments
         self.client_id = client_id
@@ -46,12 +100,22 @@ class SalesforceAPITotalUsageExtractor:
         self.jwt_key_file = jwt_key_file
         self.instance_url = instance_url
         self.org_alias = org_alias
+        self.max_workers = max_workers
+        self.compress = compress
 
         # Output configuration
         self.output_dir = Path(output_dir)
 
         # Create output directory
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.output_subdir = self.output_dir / "output"
+
+        # Cache directory for state reused between runs (access token, download manifest, lock files)
+        self.cache_dir = self.output_dir / ".cache"
+        self.token_cache_file = self.cache_dir / "token.json"
+        self.auth_lock_file = self.cache_dir / "auth.lock"
+        self.manifest_file = self.cache_dir / "manifest.json"
+        self.manifest_lock_file = self.cache_dir / "manifest.lock"
 
         # Validate configuration
         self.validate_config()
@@ -67,6 +131,33 @@ class SalesforceAPITotalUsageExtractor:
         self.api_version = None
         self.actual_instance_url = None
 
+        # Shared HTTP session so downloads reuse keep-alive connections
+        self.session = self.create_session()
+
+        # Serializes re-authentication when several downloads hit an expired token
+        self.auth_lock = threading.Lock()
+
+        # Create the CSV subdirectory once, after the output directory passed validation
+        self.output_subdir.mkdir(exist_ok=True)
+
+    def create_session(self) -> requests.Session:
+        """Create an HTTP session with connection pooling and retries for transient errors."""
+        session = requests.Session()
+        retries = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504]
+        )
+        # Every download thread needs its own pooled connection, or urllib3 discards the extras
+        pool_size = max(self.max_workers, HTTP_POOL_SIZE)
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=retries
+        )
+        session.mount('https://', adapter)
+        return session
+
     def setup_logging(self):
         """Setup logging with current timestamp."""
         # Create log file in logs directory with current timestamp initially
@@ -122,12 +213,12 @@ class SalesforceAPITotalUsageExtractor:
             result = subprocess.run(
                 command,
                 capture_output=True,
-                text=True,
                 check=True
             )
 
             if result.stdout:
-                parsed_result = json.loads(result.stdout)
+                # Parse the raw bytes directly; both parsers accept UTF-8 input
+                parsed_result = parse_json(result.stdout)
 
                 # Check if SF CLI returned an error in JSON format (status != 0)
                 if parsed_result.get('status') != 0:
@@ -140,14 +231,128 @@ class SalesforceAPITotalUsageExtractor:
 
         except subprocess.CalledProcessError as e:
             self.logger.error(f"SF CLI command failed: {' '.join(command)}")
-            self.logger.error(f"Error: {e.stderr}")
+            self.logger.error(f"Error: {e.stderr.decode('utf-8', errors='replace')}")
             raise
         except json.JSONDecodeError as e:
             self.logger.error(f"Failed to parse SF CLI JSON output: {e}")
             raise
 
-    def authenticate(self):
-        """Authenticate with Salesforce using JWT flow via SF CLI."""
+    def _load_cached_token(self) -> Optional[Dict]:
+        """Return the cached org details if they belong to this org and have not expired."""
+        try:
+            with open(self.token_cache_file, 'r') as f:
+                cached = json.load(f)
+
+            if cached.get('username') != self.username or cached.get('instance_url_config') != self.instance_url:
+                return None
+
+            expires_at = datetime.fromisoformat(cached['expires_at'])
+            if datetime.utcnow() >= expires_at - TOKEN_EXPIRY_MARGIN:
+                return None
+
+            if not all([cached.get('access_token'), cached.get('api_version'), cached.get('instance_url')]):
+                return None
+
+            return cached
+
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _save_cached_token(self):
+        """Persist the current org details so later runs can skip the SF CLI login."""
+        cached = {
+            'username': self.username,
+            'instance_url_config': self.instance_url,
+            'access_token': self.access_token,
+            'api_version': self.api_version,
+            'instance_url': self.actual_instance_url,
+            'expires_at': (datetime.utcnow() + TOKEN_CACHE_TTL).isoformat()
+        }
+
+        try:
+            self._write_cache_file(self.token_cache_file, cached)
+        except OSError as e:
+            # Caching is an optimization only, so never fail the run because of it
+            self.logger.warning(f"Failed to cache access token: {e}")
+
+    def _write_cache_file(self, cache_file: Path, data: Dict):
+        """Write JSON to a temporary file readable only by the owner, then swap it in atomically."""
+        self.cache_dir.mkdir(exist_ok=True)
+        # A unique temporary name per writer keeps overlapping runs from sharing one file;
+        # NamedTemporaryFile creates it with owner-only (0600) permissions
+        with tempfile.NamedTemporaryFile('w', dir=self.cache_dir, prefix=f"{cache_file.name}.",
+                                         suffix='.tmp', delete=False) as f:
+            json.dump(data, f)
+        try:
+            os.replace(f.name, cache_file)
+        except OSError:
+            os.unlink(f.name)
+            raise
+
+    def _load_manifest(self) -> Dict:
+        """Return previously downloaded files keyed by EventLogFile ID."""
+        try:
+            with open(self.manifest_file, 'r') as f:
+                manifest = json.load(f)
+            return manifest if isinstance(manifest, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _save_manifest(self, downloaded: Dict):
+        """Merge this run's downloads into the manifest so later runs can skip them without any request."""
+        if not downloaded:
+            return
+
+        try:
+            # Re-read under the lock so entries saved by an overlapping run are kept
+            with self.cache_file_lock(self.manifest_lock_file):
+                manifest = self._load_manifest()
+                manifest.update(downloaded)
+                self._write_cache_file(self.manifest_file, manifest)
+        except OSError as e:
+            self.logger.warning(f"Failed to save download manifest: {e}")
+
+    @contextmanager
+    def cache_file_lock(self, lock_path: Path):
+        """Hold an exclusive lock on a file in the cache directory across processes."""
+        if fcntl is None:
+            yield
+            return
+
+        self.cache_dir.mkdir(exist_ok=True)
+        with open(lock_path, 'w') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def set_org_details(self, access_token: str, api_version: str, instance_url: str):
+        """Store org details and register the Bearer token once on the shared session."""
+        # Update the header before publishing the token, so a thread that sees the
+        # new token in refresh_access_token also sends it on its retry
+        self.session.headers['Authorization'] = f'Bearer {access_token}'
+        self.api_version = api_version
+        self.actual_instance_url = instance_url
+        self.access_token = access_token
+
+    def authenticate(self, rejected_token: Optional[str] = None):
+        """Authenticate with Salesforce, reusing a cached token unless it is the rejected one."""
+        # Another run may be logging in right now; wait for it and reuse its token,
+        # so overlapping runs perform the JWT login only once
+        with self.cache_file_lock(self.auth_lock_file):
+            cached = self._load_cached_token()
+            if cached and cached['access_token'] != rejected_token:
+                self.set_org_details(cached['access_token'], cached['api_version'], cached['instance_url'])
+
+                self.logger.info("Using cached access token")
+                self.logger.info(f"Salesforce org version: v{self.api_version}")
+                return
+
+            self.login_with_jwt()
+
+    def login_with_jwt(self):
+        """Authenticate with Salesforce using JWT flow via SF CLI and cache the resulting token."""
         self.logger.info("Authenticating with Salesforce using JWT flow...")
 
         auth_command = [
@@ -174,13 +379,16 @@ class SalesforceAPITotalUsageExtractor:
             ])
 
             result = org_info.get('result', {})
-            self.access_token = result.get('accessToken')
-            self.api_version = result.get('apiVersion')
-            self.actual_instance_url = result.get('instanceUrl')
+            access_token = result.get('accessToken')
+            api_version = result.get('apiVersion')
+            instance_url = result.get('instanceUrl')
 
-            if not all([self.access_token, self.api_version, self.actual_instance_url]):
+            if not all([access_token, api_version, instance_url]):
                 raise Exception("Failed to extract required org information")
 
+            self.set_org_details(access_token, api_version, instance_url)
+            self._save_cached_token()
+
             self.logger.info(f"Salesforce org version: v{self.api_version}")
             self.logger.info("Authentication completed successfully")
 
@@ -188,8 +396,38 @@ class SalesforceAPITotalUsageExtractor:
             self.logger.error(f"Authentication failed: {e}")
             raise
 
+    def refresh_access_token(self, rejected_token: str):
+        """Log in again after Salesforce rejected a token, unless another thread already did."""
+        with self.auth_lock:
+            if self.access_token != rejected_token:
+                return
+            self.logger.info("Access token rejected, re-authenticating...")
+            self.authenticate(rejected_token=rejected_token)
+
+    def authorized_request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request through the shared session, re-authenticating and retrying once on HTTP 401."""
+        token = self.access_token
+        response = self.session.request(method, url, **kwargs)
+
+        if response.status_code == 401:
+            response.close()
+            self.refresh_access_token(token)
+            response = self.session.request(method, url, **kwargs)
+
+        response.raise_for_status()
+        return response
+
+    def authorized_get(self, url: str, **kwargs) -> requests.Response:
+        """GET through the shared session, re-authenticating and retrying once on HTTP 401."""
+        return self.authorized_request('GET', url, **kwargs)
+
+    def _rest_get(self, path: str, params: Optional[Dict] = None) -> Dict:
+        """GET a Salesforce REST API path relative to the instance URL and return the JSON body."""
+        response = self.authorized_get(f"{self.actual_instance_url}{path}", params=params, timeout=120)
+        return parse_json(response.content)
+
     def query_eventlog_metadata(self) -> List[Dict]:
-        """Query EventLogFile metadata using SF CLI."""
+        """Query EventLogFile metadata using the REST query endpoint."""
         # Use the pre-calculated target date for the query
         start_date = f"{self.target_date}T00:00:00.000Z"
         end_date = f"{self.target_date + timedelta(days=1)}T00:00:00.000Z"
@@ -197,7 +435,7 @@ class SalesforceAPITotalUsageExtractor:
         self.logger.info(f"Querying Event Log Files for date range: {start_date} to {end_date}")
 
         soql_query = (
-            "SELECT Id, EventType, LogDate "
+            "SELECT Id, EventType, LogDate, LogFileLength "
             "FROM EventLogFile "
             "WHERE EventType = 'ApiTotalUsage' "
             "AND Interval = 'Daily' "
@@ -206,15 +444,16 @@ class SalesforceAPITotalUsageExtractor:
         )
 
         try:
-            query_result = self.run_sf_command([
-                'sf', 'data', 'query',
-                '--query', soql_query,
-                '--target-org', self.org_alias,
-                '--result-format', 'json'
-            ])
+            query_result = self._rest_get(
+                f"/services/data/v{self.api_version}/query",
+                params={'q': soql_query}
+            )
+            records = query_result.get('records', [])
 
-            result = query_result.get('result', {})
-            records = result.get('records', [])
+            # Follow pagination links when the result set spans several batches
+            while not query_result.get('done', True) and query_result.get('nextRecordsUrl'):
+                query_result = self._rest_get(query_result['nextRecordsUrl'])
+                records.extend(query_result.get('records', []))
 
             self.logger.info(f"Found {len(records)} EventLogFile record(s)")
             return records
@@ -223,77 +462,265 @@ class SalesforceAPITotalUsageExtractor:
             self.logger.error(f"Failed to query EventLogFile metadata: {e}")
             raise
 
-    def stream_csv_to_file(self, log_id: str, output_file: Path) -> int:
-        """Stream CSV data directly to file and return record count."""
-        try:
-            download_url = f"{self.actual_instance_url}/services/data/v{self.api_version}/sobjects/EventLogFile/{log_id}/LogFile"
-
-            headers = {
-                'Authorization': f'Bearer {self.access_token}'
-            }
-
-            response = requests.get(download_url, headers=headers, stream=True, timeout=600)
-            response.raise_for_status()
+    def open_output_file(self, output_file: Path):
+        """Open a CSV output file for binary writing, gzip-compressed when enabled."""
+        if self.compress:
+            return gzip.open(output_file, 'wb', compresslevel=GZIP_COMPRESS_LEVEL)
+        return open(output_file, 'wb')
 
-            # Get file size and calculate optimal chunk size
-            content_length = int(response.headers.get('content-length', 0))
-            chunk_size = min(max(1024 * 1024, content_length // 100), 2 * 1024 * 1024)
+    def stream_csv_to_file(self, log_id: str, output_file: Path, expected_length: Optional[int] = None) -> int:
+        """Stream CSV data to file, check it against the expected size, and return record count."""
+        for attempt in range(1, DOWNLOAD_ATTEMPTS + 1):
+            line_count, decoded_size = self.copy_logfile_to_file(log_id, output_file)
 
-            if content_length > 0:
-                self.logger.info(f"File size: {content_length:,} bytes, using chunk size: {chunk_size:,}")
+            if expected_length is None or decoded_size == expected_length:
+                # Return total records (subtract 1 for header line)
+                return max(0, line_count - 1)
 
-            line_count = 0
+            self.logger.warning(f"Incomplete download for EventLogFile {log_id} (attempt {attempt}): "
+                                f"got {decoded_size:,} of {expected_length:,} bytes")
 
-            # Write as binary file for maximum efficiency
-            with open(output_file, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=chunk_size, decode_unicode=False):
-                    if chunk:
-                        f.write(chunk)
-                        # Count newlines efficiently on bytes
-                        line_count += chunk.count(b'\n')
+        # Never leave a short file behind where a later run could mistake it for a complete one
+        try:
+            output_file.unlink()
+        except FileNotFoundError:
+            pass
+        raise Exception(f"Incomplete download for EventLogFile {log_id} after {DOWNLOAD_ATTEMPTS} attempts")
 
-            # Return total records (subtract 1 for header line)
-            return max(0, line_count - 1)
+    def copy_logfile_to_file(self, log_id: str, output_file: Path) -> Tuple[int, int]:
+        """Stream one EventLogFile body to file and return its newline count and decoded size."""
+        try:
+            download_url = f"{self.actual_instance_url}/services/data/v{self.api_version}/sobjects/EventLogFile/{log_id}/LogFile"
 
-        except requests.RequestException as e:
+            response = self.authorized_get(download_url, stream=True, timeout=600)
+
+            # Copy the body to disk with a fixed 1 MiB buffer; records are counted
+            # once after the write instead of per chunk.
+            # Zero-copy (os.splice/os.sendfile) from the socket is not possible here:
+            # Salesforce is HTTPS-only, so every byte must be TLS-decrypted in userspace.
+            with response:
+                if self.compress and response.headers.get('content-encoding', '').lower() == 'gzip':
+                    # The body is already a gzip stream, so store it as-is instead of
+                    # decompressing and compressing it again
+                    response.raw.decode_content = False
+                    with open(output_file, 'wb') as f:
+                        shutil.copyfileobj(response.raw, f, length=CHUNK_SIZE)
+                else:
+                    response.raw.decode_content = True
+                    with self.open_output_file(output_file) as f:
+                        shutil.copyfileobj(response.raw, f, length=CHUNK_SIZE)
+
+            return self.count_lines_and_bytes(output_file)
+
+        except (requests.RequestException, Urllib3HTTPError) as e:
+            # Reading response.raw directly raises urllib3 errors for mid-body failures
             self.logger.error(f"Failed to download CSV for EventLogFile {log_id}: {e}")
             raise
         except IOError as e:
             self.logger.error(f"Failed to write CSV file {output_file}: {e}")
             raise
 
+    @staticmethod
+    def count_lines_and_bytes(file_path: Path) -> Tuple[int, int]:
+        """Count newlines and decoded bytes in a plain or gzip-compressed file in one pass."""
+        buffer = bytearray(8 * 1024 * 1024)
+        line_count = 0
+        byte_count = 0
+        opener = gzip.open(file_path, 'rb') if file_path.suffix == '.gz' else open(file_path, 'rb', buffering=0)
+        with opener as f:
+            while True:
+                bytes_read = f.readinto(buffer)
+                if not bytes_read:
+                    break
+                line_count += buffer.count(b'\n', 0, bytes_read)
+                byte_count += bytes_read
+        return line_count, byte_count
+
+    def fetch_many_logfiles(self, downloads: List[Tuple[str, Path]],
+                            log_lengths: Dict[str, int]) -> Tuple[Dict[str, int], List[Tuple[str, Path]]]:
+        """Download several EventLogFiles with Composite Batch requests.
+
+        Returns record counts by ID for the files saved, plus the files that still need streaming.
+        """
+        composite_url = f"{self.actual_instance_url}/services/data/v{self.api_version}/composite/batch"
+        record_counts = {}
+        remaining = []
+
+        for start in range(0, len(downloads), COMPOSITE_BATCH_LIMIT):
+            batch = downloads[start:start + COMPOSITE_BATCH_LIMIT]
+            body = {
+                'haltOnError': False,
+                'batchRequests': [
+                    {'method': 'GET', 'url': f"v{self.api_version}/sobjects/EventLogFile/{log_id}/LogFile"}
+                    for log_id, _ in batch
+                ]
+            }
+
+            self.logger.info(f"Downloading {len(batch)} EventLogFile(s) in one Composite Batch request")
+            try:
+                response = self.authorized_request('POST', composite_url, json=body, timeout=600)
+                results = parse_json(response.content).get('results', [])
+            except (requests.RequestException, ValueError) as e:
+                # Composite Batch is only an optimization; per-file streaming still works
+                self.logger.warning(f"Composite Batch download failed, streaming files instead: {e}")
+                remaining.extend(batch)
+                continue
+
+            for index, (log_id, csv_filename) in enumerate(batch):
+                result = results[index] if index < len(results) else {}
+                csv_data = result.get('result')
+
+                if result.get('statusCode') != 200 or not isinstance(csv_data, str):
+                    # Sub-request failed or returned something other than CSV text
+                    self.logger.info(f"Composite result unusable for EventLogFile {log_id}, streaming it instead")
+                    remaining.append((log_id, csv_filename))
+                    continue
+
+                csv_bytes = csv_data.encode('utf-8')
+                if len(csv_bytes) != log_lengths[log_id]:
+                    # Not the complete file (error text, encoded or truncated body); never write it
+                    self.logger.info(f"Composite result size mismatch for EventLogFile {log_id}, streaming it instead")
+                    remaining.append((log_id, csv_filename))
+                    continue
+
+                try:
+                    with self.open_output_file(csv_filename) as f:
+                        f.write(csv_bytes)
+                except IOError as e:
+                    self.logger.error(f"Failed to write CSV file {csv_filename}: {e}")
+                    raise
+
+                # Subtract 1 for header line
+                record_counts[log_id] = max(0, csv_bytes.count(b'\n') - 1)
+
+        return record_counts, remaining
+
+    def is_already_downloaded(self, log_id: str, csv_filename: Path, log_length, manifest: Dict) -> bool:
+        """Check whether a complete copy of the EventLogFile is already on disk."""
+        if not csv_filename.exists():
+            return False
+        file_size = csv_filename.stat().st_size
+
+        # Same file and size as recorded after an earlier verified download
+        entry = manifest.get(log_id)
+        entry_matches = bool(entry) and entry.get('file') == csv_filename.name and entry.get('size') == file_size
+
+        if self.compress:
+            # The compressed size says nothing about completeness, so rely on the manifest,
+            # which also records the decoded length the file was checked against
+            return entry_matches and (log_length is None or entry.get('length') == int(float(log_length)))
+
+        # LogFileLength is free to compare and always wins over the manifest
+        if log_length is None:
+            if entry_matches:
+                return True
+
+            # Ask for the unencoded size, since a gzip-encoded length would never match the file
+            download_url = f"{self.actual_instance_url}/services/data/v{self.api_version}/sobjects/EventLogFile/{log_id}/LogFile"
+            try:
+                response = self.authorized_request('HEAD', download_url, headers={'Accept-Encoding': 'identity'}, timeout=120)
+                log_length = response.headers.get('content-length')
+            except requests.RequestException as e:
+                self.logger.warning(f"Failed to check size of EventLogFile {log_id}: {e}")
+                return False
+
+        return log_length is not None and int(float(log_length)) == file_size
+
+    def record_downloaded_file(self, downloaded: Dict, log_id: str, csv_filename: Path, total_records: int,
+                               log_length: Optional[int]):
+        """Add a finished download to the entries saved in the manifest and log it once."""
+        file_size = csv_filename.stat().st_size
+        downloaded[log_id] = {
+            'file': csv_filename.name,
+            'size': file_size,
+            'length': log_length,
+            'records': total_records
+        }
+        self.logger.info("Saved EventLogFile %s: %d API calls, %d bytes -> %s",
+                         log_id, total_records, file_size, csv_filename)
 
     def process_eventlog_files(self, records: List[Dict]):
-        """Process each EventLogFile record and save CSV data using streaming."""
+        """Process each EventLogFile record and save CSV data using parallel streaming downloads."""
+        manifest = self._load_manifest()
 
+        downloads = []
+        log_lengths = {}
         for record in records:
             log_id = record['Id']
             log_date = record['LogDate']
 
-            self.logger.info(f"Processing EventLogFile: {log_id} (Date: {log_date})")
-
             # Create filename with date and EventLogFile ID in output subdirectory
             date_timestamp = ''.join(filter(str.isdigit, log_date))[:8]
-            output_subdir = self.output_dir / "output"
-            output_subdir.mkdir(exist_ok=True)
-            csv_filename = output_subdir / f"ApiTotalUsage_{date_timestamp}_{log_id}.csv"
+            extension = "csv.gz" if self.compress else "csv"
+            csv_filename = self.output_subdir / f"ApiTotalUsage_{date_timestamp}_{log_id}.{extension}"
 
-            # Stream CSV data directly to file
-            self.logger.info(f"Streaming CSV data for EventLogFile: {log_id}")
-            try:
-                total_records = self.stream_csv_to_file(log_id, csv_filename)
+            log_length = record.get('LogFileLength')
+            if self.is_already_downloaded(log_id, csv_filename, log_length, manifest):
+                self.logger.info(f"Skipping EventLogFile {log_id}, already downloaded: {csv_filename}")
+                continue
+
+            downloads.append((log_id, csv_filename))
 
-                self.logger.info(f"Saved complete ApiTotalUsage file with {total_records} total API calls")
-                self.logger.info(f"Complete API usage data saved to: {csv_filename}")
+            log_lengths[log_id] = int(float(log_length)) if log_length is not None else None
 
-                # Log and show CSV file creation
-                self.logger.info(f"CSV file created: {csv_filename}")
-                print(f"CSV file created: {csv_filename}")
+        if not downloads:
+            self.logger.info("All EventLogFile records are already downloaded.")
+            return
 
+        downloaded = {}
+        try:
+            self.download_eventlog_files(downloads, log_lengths, downloaded)
+        finally:
+            # Keep whatever finished, even if a later download failed
+            self._save_manifest(downloaded)
+
+    def download_eventlog_files(self, downloads: List[Tuple[str, Path]], log_lengths: Dict[str, Optional[int]],
+                                downloaded: Dict):
+        """Download EventLogFiles via Composite Batch when small, streaming the rest in parallel."""
+        # Several small files are cheaper as one Composite Batch round trip than one GET each
+        # Unknown sizes count as too large so they are always streamed
+        lengths = [log_lengths[log_id] for log_id, _ in downloads]
+        if len(downloads) > 1 and None not in lengths and sum(lengths) <= COMPOSITE_BATCH_MAX_BYTES:
+            csv_filenames = dict(downloads)
+            try:
+                record_counts, downloads = self.fetch_many_logfiles(downloads, log_lengths)
             except Exception as e:
-                self.logger.error(f"Failed to process EventLogFile {log_id}: {e}")
+                self.logger.error(f"Failed to process EventLogFiles: {e}")
                 raise
 
+            for log_id, total_records in record_counts.items():
+                csv_filename = csv_filenames[log_id]
+                self.record_downloaded_file(downloaded, log_id, csv_filename, total_records, log_lengths[log_id])
+
+            if not downloads:
+                return
+
+        self.stream_eventlog_files(downloads, log_lengths, downloaded)
+
+    def stream_eventlog_files(self, downloads: List[Tuple[str, Path]], log_lengths: Dict[str, Optional[int]],
+                              downloaded: Dict):
+        """Stream EventLogFiles to disk in parallel on a bounded thread pool."""
+        max_workers = min(self.max_workers, len(downloads))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for log_id, csv_filename in downloads:
+                # Stream CSV data directly to file
+                future = executor.submit(self.stream_csv_to_file, log_id, csv_filename, log_lengths[log_id])
+                futures[future] = (log_id, csv_filename)
+
+            for future in as_completed(futures):
+                log_id, csv_filename = futures[future]
+                try:
+                    total_records = future.result()
+                    self.record_downloaded_file(downloaded, log_id, csv_filename, total_records, log_lengths[log_id])
+
+                except Exception as e:
+                    self.logger.error(f"Failed to process EventLogFile {log_id}: {e}")
+                    # Don't start downloads that are still queued
+                    for pending in futures:
+                        pending.cancel()
+                    raise
+
     def run(self):
         """Main execution method."""
         try:
@@ -302,7 +729,7 @@ class SalesforceAPITotalUsageExtractor:
             # Authenticate with Salesforce using SF CLI
             self.authenticate()
 
-            # Query EventLogFile metadata using SF CLI
+            # Query EventLogFile metadata using the REST API
             records = self.query_eventlog_metadata()
 
             # Always print the log file path for user reference
@@ -340,16 +767,25 @@ def main():
     required_args.add_argument('--instance-url', required=True, help='Salesforce instance my domain URL')
     required_args.add_argument('--org-alias', required=True, help='Org alias for Salesforce CLI')
     required_args.add_argument('--output-dir', required=True, help='Output directory for CSV files')
+    parser.add_argument('--compress', action='store_true',
+                        help='Write gzip-compressed CSV files (.csv.gz)')
+    parser.add_argument('--max-workers', type=int, default=DEFAULT_DOWNLOAD_WORKERS,
+                        help=f'Maximum number of concurrent EventLogFile downloads, 1-{MAX_DOWNLOAD_WORKERS} (default: {DEFAULT_DOWNLOAD_WORKERS})')
 
     args = parser.parse_args()
 
+    if not 1 <= args.max_workers <= MAX_DOWNLOAD_WORKERS:
+        parser.error(f"--max-workers must be between 1 and {MAX_DOWNLOAD_WORKERS}")
+
     extractor = SalesforceAPITotalUsageExtractor(
         args.client_id,
         args.username,
         args.jwt_key_file,
         args.instance_url,
         args.org_alias,
-        args.output_dir
+        args.output_dir,
+        args.max_workers,
+        args.compress
     )
     extractor.run()
 